@@ -4,3 +4,7 @@ try:
     load_dotenv(override=True)
 except ModuleNotFoundError:
     pass
+
+from jab import log
+
+log.setup()
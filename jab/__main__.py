@@ -9,19 +9,30 @@ from jab import constants
 
 log = logging.getLogger(__name__)
 
-intents = discord.Intents.all()
-intents.members = True
+# Only subscribe to what the bot uses: prefix commands need message content,
+# members/presences/typing are privileged or high volume and never read.
+intents = discord.Intents.default()
+intents.message_content = True
+intents.typing = False
 bot = commands.Bot(command_prefix=constants.BotConstants.prefix, intents=intents, help_command=None)
 
 async def load():
     for filename in os.listdir('./jab/cogs'):
         if filename.endswith('.py'):
             extension = f"jab.cogs.{filename[:-3]}"
-            print(f'Try to load {filename} as {extension}')
-            await bot.load_extension(extension)
+            if extension in bot.extensions:
+                continue
+            log.info("Try to load %s as %s", filename, extension)
+            try:
+                await bot.load_extension(extension)
+            except commands.ExtensionError:
+                log.exception("Failed to load %s", extension)
+
+# setup_hook runs exactly once per process, before the gateway connects
+bot.setup_hook = load
 
 async def main():
-    await load()
-    await bot.start(constants.BotConstants.token)
+    async with bot:
+        await bot.start(constants.BotConstants.token)
 
 asyncio.run(main())
\ No newline at end of file
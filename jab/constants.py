@@ -1,9 +1,5 @@
 import os
-import dataclasses
-import enum
 import logging
-from datetime import datetime
-from os import environ
 from typing import NamedTuple
 
 __all__ = (
@@ -0,0 +1,33 @@
+import atexit
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+
+from jab import constants
+
+__all__ = ("setup",)
+
+FORMAT = "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s"
+
+
+def setup():
+    """Route all logging through a queue so the event loop never blocks writing to stdout."""
+    log_queue = queue.SimpleQueue()
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter(FORMAT))
+
+    listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    root = logging.getLogger()
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(logging.DEBUG if constants.Logging.debug else logging.INFO)
+
+    # discord.py is very chatty at DEBUG, keep it at INFO unless explicitly traced
+    logging.getLogger("discord").setLevel(logging.INFO)
+    if constants.Logging.trace_loggers:
+        for name in constants.Logging.trace_loggers.split(","):
+            logging.getLogger(name.strip()).setLevel(logging.DEBUG)